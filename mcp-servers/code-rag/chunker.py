@@ -1,3 +1,4 @@
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -6,7 +7,7 @@ import xxhash
 from parser import Symbol
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     id: str
     file_path: str
@@ -22,6 +23,8 @@ class Chunk:
 
 IMPORT_KEYWORDS = {"import", "require", "use", "include", "from", "package", "namespace", "mod"}
 
+_GAP_RE = re.compile(rb"\x00+")
+
 
 def _make_id(file_path: str, start_line: int, end_line: int) -> str:
     return xxhash.xxh64(f"{file_path}:{start_line}:{end_line}").hexdigest()
@@ -42,12 +45,14 @@ class Chunker:
         context = self._build_context(file_path, source_lines)
         merged = self._merge_small(symbols)
         chunks = []
-        covered = set()
+        total = len(source_lines)
+        covered = bytearray(total + 1)
         for sym in merged:
             for chunk in self._symbol_to_chunks(file_path, sym, source_lines, context):
                 chunks.append(chunk)
-                for ln in range(chunk.start_line, chunk.end_line + 1):
-                    covered.add(ln)
+                end = min(chunk.end_line, total)
+                if end >= chunk.start_line:
+                    covered[chunk.start_line:end + 1] = b"\x01" * (end - chunk.start_line + 1)
         gap_chunks = self._gap_chunks(file_path, symbols, source_lines, covered, context)
         chunks.extend(gap_chunks)
         return sorted(chunks, key=lambda c: c.start_line)
@@ -92,13 +97,16 @@ class Chunker:
             return []
         result = []
         buffer = [symbols[0]]
+        total = symbols[0].end_line - symbols[0].start_line + 1
         for sym in symbols[1:]:
-            total = sum(s.end_line - s.start_line + 1 for s in buffer)
+            span = sym.end_line - sym.start_line + 1
             if total < self._min_lines and sym.start_line == buffer[-1].end_line + 1:
                 buffer.append(sym)
+                total += span
             else:
                 result.append(self._collapse(buffer))
                 buffer = [sym]
+                total = span
         result.append(self._collapse(buffer))
         return result
 
@@ -113,35 +121,18 @@ class Chunker:
             parent=syms[0].parent, language=syms[0].language,
         )
 
-    def _gap_chunks(self, file_path: str, symbols: list[Symbol], source_lines: list[str], covered: set, context: str) -> list[Chunk]:
-        total = len(source_lines)
+    def _gap_chunks(self, file_path: str, symbols: list[Symbol], source_lines: list[str], covered: bytearray, context: str) -> list[Chunk]:
+        language = symbols[0].language if symbols else ""
         chunks = []
-        gap_start = None
-        for ln in range(1, total + 1):
-            if ln not in covered:
-                if gap_start is None:
-                    gap_start = ln
-            else:
-                if gap_start is not None:
-                    gap_end = ln - 1
-                    content = _lines_to_content(source_lines, gap_start, gap_end)
-                    if content.strip():
-                        chunks.append(Chunk(
-                            id=_make_id(file_path, gap_start, gap_end),
-                            file_path=file_path, start_line=gap_start, end_line=gap_end,
-                            content=content, symbol_name="", symbol_type="module_header",
-                            language=symbols[0].language if symbols else "", signature="", context=context,
-                        ))
-                    gap_start = None
-        if gap_start is not None:
-            gap_end = total
+        for m in _GAP_RE.finditer(covered, 1):
+            gap_start, gap_end = m.start(), m.end() - 1
             content = _lines_to_content(source_lines, gap_start, gap_end)
             if content.strip():
                 chunks.append(Chunk(
                     id=_make_id(file_path, gap_start, gap_end),
                     file_path=file_path, start_line=gap_start, end_line=gap_end,
                     content=content, symbol_name="", symbol_type="module_header",
-                    language=symbols[0].language if symbols else "", signature="", context=context,
+                    language=language, signature="", context=context,
                 ))
         return chunks
 
@@ -8,22 +8,34 @@ LANG_MAP = {
     ".json": "json", ".yaml": "yaml", ".yml": "yaml", ".toml": "toml",
 }
 
-MODULE_ONLY_LANGS = {"json", "yaml", "toml", "css", "sql", "html"}
+MODULE_ONLY_LANGS = frozenset({"json", "yaml", "toml", "css", "sql", "html"})
 
-GO_NODES = {"function_declaration", "method_declaration", "type_declaration"}
-PHP_NODES = {"function_definition", "method_declaration", "class_declaration", "interface_declaration"}
-JAVA_NODES = {"method_declaration", "class_declaration", "interface_declaration"}
-RUST_NODES = {"function_item", "struct_item", "trait_item", "impl_item"}
-JS_NODES = {"function_declaration", "arrow_function", "method_definition", "class_declaration"}
+GO_NODES = frozenset({"function_declaration", "method_declaration", "type_declaration"})
+PHP_NODES = frozenset({"function_definition", "method_declaration", "class_declaration", "interface_declaration"})
+JAVA_NODES = frozenset({"method_declaration", "class_declaration", "interface_declaration"})
+RUST_NODES = frozenset({"function_item", "struct_item", "trait_item", "impl_item"})
+JS_NODES = frozenset({"function_declaration", "arrow_function", "method_definition", "class_declaration"})
 TS_NODES = JS_NODES | {"interface_declaration"}
+NESTING_NODES = frozenset({"class_declaration", "impl_item", "trait_item"})
 
-LANG_NODES: dict[str, set[str]] = {
+LANG_NODES: dict[str, frozenset[str]] = {
     "go": GO_NODES, "php": PHP_NODES, "java": JAVA_NODES,
     "rust": RUST_NODES, "javascript": JS_NODES, "typescript": TS_NODES,
 }
 
+NODE_SYM_TYPES = {
+    "function_declaration": "function", "function_definition": "function",
+    "function_item": "function", "method_declaration": "method",
+    "method_definition": "method", "arrow_function": "function",
+    "class_declaration": "class", "interface_declaration": "interface",
+    "struct_item": "struct", "trait_item": "trait", "impl_item": "impl",
+    "type_declaration": "type",
+}
+
+_parsers: dict[str, object] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     name: str
     type: str
@@ -40,8 +52,10 @@ def _node_text(node, source_bytes: bytes) -> str:
 
 
 def _first_line(node, source_bytes: bytes) -> str:
-    text = _node_text(node, source_bytes)
-    return text.split("\n")[0][:200]
+    end = source_bytes.find(b"\n", node.start_byte, node.end_byte)
+    if end == -1:
+        end = node.end_byte
+    return source_bytes[node.start_byte:end].decode("utf-8", errors="replace")[:200]
 
 
 def _get_name(node, source_bytes: bytes, lang: str) -> str:
@@ -58,36 +72,28 @@ def _get_name(node, source_bytes: bytes, lang: str) -> str:
 
 
 def _node_sym_type(node_type: str) -> str:
-    mapping = {
-        "function_declaration": "function", "function_definition": "function",
-        "function_item": "function", "method_declaration": "method",
-        "method_definition": "method", "arrow_function": "function",
-        "class_declaration": "class", "interface_declaration": "interface",
-        "struct_item": "struct", "trait_item": "trait", "impl_item": "impl",
-        "type_declaration": "type",
-    }
-    return mapping.get(node_type, node_type)
+    return NODE_SYM_TYPES.get(node_type, node_type)
 
 
-class CodeParser:
-    def __init__(self):
-        self._parsers: dict[str, object] = {}
+def _get_parser(lang: str):
+    parser = _parsers.get(lang)
+    if parser is None:
+        from tree_sitter_languages import get_parser
+        parser = _parsers[lang] = get_parser(lang)
+    return parser
 
-    def _get_parser(self, lang: str):
-        if lang not in self._parsers:
-            from tree_sitter_languages import get_parser
-            self._parsers[lang] = get_parser(lang)
-        return self._parsers[lang]
 
-    def parse_file(self, file_path: str | Path) -> list[Symbol]:
+class CodeParser:
+    def parse_file(self, file_path: str | Path, source: bytes | None = None) -> list[Symbol]:
         file_path = Path(file_path)
         suffix = file_path.suffix.lower()
         lang = LANG_MAP.get(suffix)
         if lang is None:
             return []
-        source = file_path.read_bytes()
-        source_text = source.decode("utf-8", errors="replace")
+        if source is None:
+            source = file_path.read_bytes()
         if lang in MODULE_ONLY_LANGS:
+            source_text = source.decode("utf-8", errors="replace")
             return [Symbol(
                 name=file_path.name, type="module", start_line=1,
                 end_line=len(source_text.splitlines()),
@@ -95,19 +101,19 @@ class CodeParser:
                 parent=None, language=lang,
             )]
         if suffix == ".vue":
-            return self._parse_vue(source_text, file_path)
-        parser = self._get_parser(lang)
+            return self._parse_vue(source, file_path)
+        parser = _get_parser(lang)
         tree = parser.parse(source)
         return self._extract_symbols(tree.root_node, source, lang, None)
 
-    def _parse_vue(self, source_text: str, file_path: str | Path) -> list[Symbol]:
+    def _parse_vue(self, source: bytes, file_path: str | Path) -> list[Symbol]:
         file_path = Path(file_path)
-        parser = self._get_parser("html")
-        source_bytes = source_text.encode("utf-8")
-        tree = parser.parse(source_bytes)
+        parser = _get_parser("html")
+        tree = parser.parse(source)
         script_nodes = []
-        self._find_script(tree.root_node, source_bytes, script_nodes)
+        self._find_script(tree.root_node, source, script_nodes)
         if not script_nodes:
+            source_text = source.decode("utf-8", errors="replace")
             return [Symbol(
                 name=file_path.name, type="module", start_line=1,
                 end_line=len(source_text.splitlines()),
@@ -115,9 +121,8 @@ class CodeParser:
                 parent=None, language="html",
             )]
         symbols = []
-        for script_content, offset_line in script_nodes:
-            js_parser = self._get_parser("javascript")
-            js_bytes = script_content.encode("utf-8")
+        for js_bytes, offset_line in script_nodes:
+            js_parser = _get_parser("javascript")
             js_tree = js_parser.parse(js_bytes)
             for sym in self._extract_symbols(js_tree.root_node, js_bytes, "javascript", None):
                 symbols.append(Symbol(
@@ -130,18 +135,22 @@ class CodeParser:
         return symbols
 
     def _find_script(self, node, source_bytes: bytes, result: list):
-        if node.type == "script_element":
-            start = node.start_point[0]
-            text = _node_text(node, source_bytes)
-            inner = "\n".join(text.split("\n")[1:-1])
-            result.append((inner, start + 1))
-        for child in node.children:
-            self._find_script(child, source_bytes, result)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.type == "script_element":
+                first = source_bytes.find(b"\n", node.start_byte, node.end_byte)
+                last = source_bytes.rfind(b"\n", node.start_byte, node.end_byte)
+                inner = source_bytes[first + 1:last] if first != -1 else b""
+                result.append((inner, node.start_point[0] + 1))
+            stack.extend(reversed(node.named_children))
 
     def _extract_symbols(self, node, source_bytes: bytes, lang: str, parent: str | None) -> list[Symbol]:
         symbols = []
-        target_types = LANG_NODES.get(lang, set())
-        for child in node.children:
+        target_types = LANG_NODES.get(lang, frozenset())
+        stack = [(child, parent) for child in reversed(node.named_children)]
+        while stack:
+            child, parent = stack.pop()
             if child.type in target_types:
                 name = _get_name(child, source_bytes, lang)
                 sym_type = _node_sym_type(child.type)
@@ -155,8 +164,8 @@ class CodeParser:
                     parent=parent, language=lang,
                 )
                 symbols.append(sym)
-                if child.type in ("class_declaration", "impl_item", "trait_item"):
-                    symbols.extend(self._extract_symbols(child, source_bytes, lang, name))
+                if child.type in NESTING_NODES:
+                    stack.extend((c, name) for c in reversed(child.named_children))
             else:
-                symbols.extend(self._extract_symbols(child, source_bytes, lang, parent))
+                stack.extend((c, parent) for c in reversed(child.named_children))
         return symbols
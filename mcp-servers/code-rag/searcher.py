@@ -1,15 +1,19 @@
+import heapq
 import re
+from collections import OrderedDict
 
 from rank_bm25 import BM25Okapi
 
 from embedder import Embedder
 from store import Store
 
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_TOKEN_SPLIT_RE = re.compile(r"[\s_\-./\\:]+")
+_BM25_CACHE_SIZE = 4
+
 
 def _tokenize(text: str) -> list[str]:
-    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
-    text = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", text)
-    tokens = re.split(r"[\s_\-./\\:]+", text.lower())
+    tokens = _TOKEN_SPLIT_RE.split(_CAMEL_BOUNDARY_RE.sub(" ", text).lower())
     return [t for t in tokens if len(t) > 1]
 
 
@@ -19,6 +23,8 @@ class Searcher:
         self._embedder = embedder
         self._dense_weight = config["dense_weight"]
         self._sparse_weight = config["sparse_weight"]
+        self._bm25_version = -1
+        self._bm25_cache: OrderedDict[str, tuple[list[dict], BM25Okapi | None]] = OrderedDict()
 
     def search(self, query: str, top_k: int, file_pattern: str = "") -> list[dict]:
         query_vec = self._embedder.embed_query(query)
@@ -28,14 +34,12 @@ class Searcher:
         return fused[:top_k]
 
     def _bm25_search(self, query: str, top_k: int, file_pattern: str = "") -> list[dict]:
-        all_docs = self._store.get_all_contents(file_pattern)
+        all_docs, bm25 = self._bm25_index(file_pattern)
         if not all_docs:
             return []
-        corpus = [_tokenize(d["content"] + " " + d.get("symbol_name", "")) for d in all_docs]
-        bm25 = BM25Okapi(corpus)
         q_tokens = _tokenize(query)
         scores = bm25.get_scores(q_tokens)
-        indexed = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)[:top_k]
+        indexed = heapq.nlargest(top_k, enumerate(scores), key=lambda x: x[1])
         results = []
         for idx, score in indexed:
             if score > 0:
@@ -44,6 +48,22 @@ class Searcher:
                 results.append(doc)
         return results
 
+    def _bm25_index(self, file_pattern: str) -> tuple[list[dict], BM25Okapi | None]:
+        if self._bm25_version != self._store.version:
+            self._bm25_cache.clear()
+            self._bm25_version = self._store.version
+        cached = self._bm25_cache.get(file_pattern)
+        if cached is not None:
+            self._bm25_cache.move_to_end(file_pattern)
+        else:
+            all_docs = self._store.get_all_contents(file_pattern)
+            corpus = [_tokenize(d["content"] + " " + d.get("symbol_name", "")) for d in all_docs]
+            cached = (all_docs, BM25Okapi(corpus) if corpus else None)
+            self._bm25_cache[file_pattern] = cached
+            if len(self._bm25_cache) > _BM25_CACHE_SIZE:
+                self._bm25_cache.popitem(last=False)
+        return cached
+
     def _rrf_fuse(self, dense_results: list[dict], sparse_results: list[dict], k: int = 60) -> list[dict]:
         dense_ids = {r["id"]: i for i, r in enumerate(dense_results)}
         sparse_ids = {r["id"]: i for i, r in enumerate(sparse_results)}
@@ -4,12 +4,18 @@ import time
 import hashlib
 from pathlib import Path
 
+import xxhash
 import yaml
 from mcp.server.fastmcp import FastMCP
 
+_SERVER_DIR = str(Path(__file__).parent)
+if _SERVER_DIR not in sys.path:
+    sys.path.insert(0, _SERVER_DIR)
+
 mcp = FastMCP("code-rag")
 
 _config: dict | None = None
+_embedder = None
 _instances: dict[str, object] = {}
 
 
@@ -36,6 +42,14 @@ def _resolve_device(config: dict) -> str:
     return "cpu"
 
 
+def _get_embedder(config: dict):
+    global _embedder
+    if _embedder is None:
+        from embedder import Embedder
+        _embedder = Embedder(config["embedding"], _resolve_device(config))
+    return _embedder
+
+
 def _get_data_dir(project_path: str) -> Path:
     return Path(project_path) / ".claude" / "code-rag"
 
@@ -44,37 +58,58 @@ def _ensure_init(project_path: str):
     if project_path in _instances:
         return
     cfg = _load_config()
-    device = _resolve_device(cfg)
-    sys.path.insert(0, str(Path(__file__).parent))
-    from embedder import Embedder
     from store import Store
     from searcher import Searcher
     data_dir = _get_data_dir(project_path)
-    embedder = Embedder(cfg["embedding"], device)
+    embedder = _get_embedder(cfg)
     store = Store(data_dir)
     searcher = Searcher(store, embedder, cfg["search"])
-    _instances[project_path] = {"embedder": embedder, "store": store, "searcher": searcher, "device": device, "config": cfg}
+    _instances[project_path] = {"embedder": embedder, "store": store, "searcher": searcher, "device": embedder.device, "config": cfg}
 
 
-def _collect_files(root: Path, index_config: dict) -> list[Path]:
+def _collect_files(root: Path, index_config: dict) -> list[tuple[Path, os.stat_result]]:
     import fnmatch
     extensions = set(index_config["file_extensions"])
     ignore_patterns = index_config.get("ignore_patterns", [])
+    max_bytes = index_config.get("max_file_bytes", 0)
+    dir_patterns = [pat for pat in ignore_patterns if pat.endswith("*")]
     files = []
-    for f in root.rglob("*"):
-        if not f.is_file():
-            continue
-        if f.suffix.lower() not in extensions:
+    stack = [(str(root), "")]
+    while stack:
+        dirpath, prefix = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
             continue
-        rel = f.relative_to(root).as_posix()
-        if any(fnmatch.fnmatch(rel, pat) for pat in ignore_patterns):
-            continue
-        files.append(f)
+        with entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not any(fnmatch.fnmatch(rel + "/", pat) for pat in dir_patterns):
+                        stack.append((entry.path, rel + "/"))
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in extensions:
+                    continue
+                if any(fnmatch.fnmatch(rel, pat) for pat in ignore_patterns):
+                    continue
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                if st.st_size == 0 or (max_bytes and st.st_size > max_bytes):
+                    continue
+                files.append((Path(entry.path), st))
     return files
 
 
-def _file_hash(path: Path) -> str:
-    return hashlib.md5(path.read_bytes()).hexdigest()
+def _content_hash(source: bytes) -> str:
+    return xxhash.xxh128(source).hexdigest()
+
+
+def _needs_index(store, rel: str, content_hash: str, source: bytes) -> bool:
+    if not store.file_needs_index(rel, content_hash):
+        return False
+    legacy = store.legacy_hash(rel)
+    return legacy is None or legacy != hashlib.md5(source).hexdigest()
 
 
 @mcp.tool()
@@ -85,9 +120,9 @@ def index_codebase(project_path: str, force: bool = False) -> dict:
         store = ctx["store"]
         embedder = ctx["embedder"]
         cfg = ctx["config"]
-        sys.path.insert(0, str(Path(__file__).parent))
         from parser import CodeParser
         from chunker import Chunker
+        from store import chunks_table
         t0 = time.time()
         root = Path(project_path)
         files = _collect_files(root, cfg["index"])
@@ -97,37 +132,36 @@ def index_codebase(project_path: str, force: bool = False) -> dict:
         files_skipped = 0
         total_chunks = 0
         indexed_paths = set()
-        for fpath in files:
+        for fpath, st in files:
             rel = fpath.as_posix()
-            content_hash = _file_hash(fpath)
             indexed_paths.add(rel)
-            if not force and not store.file_needs_index(rel, content_hash):
+            signature = [st.st_mtime_ns, st.st_size]
+            if not force and store.file_unchanged(rel, signature):
+                files_skipped += 1
+                continue
+            source = fpath.read_bytes()
+            content_hash = _content_hash(source)
+            if not force and not _needs_index(store, rel, content_hash, source):
+                store.mark_indexed(rel, content_hash, signature)
                 files_skipped += 1
                 continue
             try:
-                source_text = fpath.read_text(encoding="utf-8", errors="replace")
-                source_lines = source_text.splitlines()
-                symbols = parser.parse_file(fpath)
+                if not source.strip():
+                    store.delete_by_file(rel)
+                    store.mark_indexed(rel, content_hash, signature)
+                    files_skipped += 1
+                    continue
+                source_lines = source.decode("utf-8", errors="replace").splitlines()
+                symbols = parser.parse_file(fpath, source)
                 chunks = chunker.chunk_file(rel, symbols, source_lines)
                 if not chunks:
                     files_skipped += 1
                     continue
                 texts = [c.content for c in chunks]
                 vecs = embedder.embed_documents(texts)
-                records = [
-                    {
-                        "id": c.id, "file_path": c.file_path,
-                        "start_line": c.start_line, "end_line": c.end_line,
-                        "content": c.content, "symbol_name": c.symbol_name,
-                        "symbol_type": c.symbol_type, "language": c.language,
-                        "signature": c.signature, "context": c.context,
-                        "vector": vecs[i].tolist(),
-                    }
-                    for i, c in enumerate(chunks)
-                ]
                 store.delete_by_file(rel)
-                store.upsert_chunks(records)
-                store.mark_indexed(rel, content_hash)
+                store.upsert_chunks(chunks_table(chunks, vecs))
+                store.mark_indexed(rel, content_hash, signature)
                 files_indexed += 1
                 total_chunks += len(chunks)
             except Exception as e:
@@ -139,7 +173,7 @@ def index_codebase(project_path: str, force: bool = False) -> dict:
             store.delete_by_file(dp)
             files_deleted += 1
         for dp in deleted:
-            store._hashes.pop(dp, None)
+            store.forget_file(dp)
         store.save_hashes()
         return {
             "status": "ok",
@@ -203,7 +237,6 @@ def get_file_summary(project_path: str, file_path: str) -> dict:
         _ensure_init(project_path)
         store = _instances[project_path]["store"]
         symbols = store.get_file_symbols(file_path)
-        sys.path.insert(0, str(Path(__file__).parent))
         from parser import LANG_MAP
         lang = LANG_MAP.get(Path(file_path).suffix.lower(), "")
         return {
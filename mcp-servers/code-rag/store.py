@@ -1,6 +1,8 @@
-import json
 import lancedb
+import numpy as np
+import orjson
 import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
 
 CHUNKS_SCHEMA = pa.schema([
@@ -18,6 +20,16 @@ CHUNKS_SCHEMA = pa.schema([
 ])
 
 
+def chunks_table(chunks: list, vectors: np.ndarray) -> pa.Table:
+    columns = {
+        field.name: [getattr(c, field.name) for c in chunks]
+        for field in CHUNKS_SCHEMA if field.name != "vector"
+    }
+    flat = pa.array(np.ascontiguousarray(vectors, dtype=np.float32).ravel(), type=pa.float32())
+    columns["vector"] = pa.FixedSizeListArray.from_arrays(flat, CHUNKS_SCHEMA.field("vector").type.list_size)
+    return pa.Table.from_pydict(columns, schema=CHUNKS_SCHEMA)
+
+
 class Store:
     def __init__(self, data_dir: Path):
         self._data_dir = data_dir
@@ -26,25 +38,29 @@ class Store:
         self._table = self.get_or_create_table()
         self._hashes_path = data_dir / "hashes.json"
         self._hashes: dict[str, str] = self._load_hashes()
+        self._stats_path = data_dir / "stats.json"
+        self._stats: dict[str, list[int]] = self._load_stats()
+        self.version = 0
 
     def get_or_create_table(self):
         if "chunks" in self._db.table_names():
             return self._db.open_table("chunks")
         return self._db.create_table("chunks", schema=CHUNKS_SCHEMA)
 
-    def upsert_chunks(self, records: list[dict]):
-        if not records:
+    def upsert_chunks(self, records: pa.Table):
+        if not records.num_rows:
             return
-        ids = [r["id"] for r in records]
-        id_list = ", ".join(f"'{i}'" for i in ids)
+        id_list = ", ".join(f"'{i}'" for i in records.column("id").to_pylist())
         try:
             self._table.delete(f"id IN ({id_list})")
         except Exception:
             pass
         self._table.add(records)
+        self.version += 1
 
     def delete_by_file(self, file_path: str):
         self._table.delete(f"file_path = '{file_path}'")
+        self.version += 1
 
     def search_vector(self, query_vec, top_k: int, file_pattern: str = "") -> list[dict]:
         q = self._table.search(query_vec).limit(top_k * 3)
@@ -70,9 +86,9 @@ class Store:
         return sorted(results, key=lambda r: r["start_line"])
 
     def get_stats(self) -> dict:
-        df = self._table.to_pandas()
-        total_files = df["file_path"].nunique() if len(df) else 0
-        total_chunks = len(df)
+        total_chunks = self._table.count_rows()
+        paths = self._table.search().select(["file_path"]).limit(total_chunks).to_arrow().column("file_path")
+        total_files = pc.count_distinct(paths).as_py()
         db_path = self._data_dir / "lancedb"
         db_size = sum(f.stat().st_size for f in db_path.rglob("*") if f.is_file()) if db_path.exists() else 0
         return {
@@ -83,17 +99,36 @@ class Store:
 
     def _load_hashes(self) -> dict[str, str]:
         if self._hashes_path.exists():
-            return json.loads(self._hashes_path.read_text(encoding="utf-8"))
+            return orjson.loads(self._hashes_path.read_bytes())
+        return {}
+
+    def _load_stats(self) -> dict[str, list[int]]:
+        if self._stats_path.exists():
+            return orjson.loads(self._stats_path.read_bytes())
         return {}
 
+    def file_unchanged(self, file_path: str, signature: list[int]) -> bool:
+        return file_path in self._hashes and self._stats.get(file_path) == signature
+
     def file_needs_index(self, file_path: str, content_hash: str) -> bool:
         return self._hashes.get(file_path) != content_hash
 
-    def mark_indexed(self, file_path: str, content_hash: str):
+    def legacy_hash(self, file_path: str) -> str | None:
+        if file_path in self._stats:
+            return None
+        return self._hashes.get(file_path)
+
+    def mark_indexed(self, file_path: str, content_hash: str, signature: list[int]):
         self._hashes[file_path] = content_hash
+        self._stats[file_path] = signature
+
+    def forget_file(self, file_path: str):
+        self._hashes.pop(file_path, None)
+        self._stats.pop(file_path, None)
 
     def save_hashes(self):
-        self._hashes_path.write_text(json.dumps(self._hashes, ensure_ascii=False), encoding="utf-8")
+        self._hashes_path.write_bytes(orjson.dumps(self._hashes))
+        self._stats_path.write_bytes(orjson.dumps(self._stats))
 
     def get_indexed_files(self) -> set[str]:
         return set(self._hashes.keys())
@@ -3,8 +3,11 @@ from dataclasses import dataclass, field
 
 from parser import DocElement, ElementType
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[。！？.!?\n])")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
 
-@dataclass
+
+@dataclass(slots=True)
 class Chunk:
     text: str
     source: str
@@ -61,39 +64,39 @@ class SemanticChunker:
             return []
         results: list[str] = []
         current: list[str] = []
+        current_sizes: list[int] = []
         current_tokens = 0
 
         for sent in sentences:
             sent_tokens = self._estimate_tokens(sent)
             if current_tokens + sent_tokens > self.max_chunk_size and current:
                 results.append(" ".join(current))
-                overlap_sents = self._get_overlap_sentences(current)
-                current = overlap_sents
-                current_tokens = sum(self._estimate_tokens(s) for s in current)
+                start = self._overlap_start(current_sizes)
+                current = current[start:]
+                current_sizes = current_sizes[start:]
+                current_tokens = sum(current_sizes)
             current.append(sent)
+            current_sizes.append(sent_tokens)
             current_tokens += sent_tokens
 
         if current:
             results.append(" ".join(current))
         return results if results else [text.strip()]
 
-    def _get_overlap_sentences(self, sentences: list[str]) -> list[str]:
-        result: list[str] = []
+    def _overlap_start(self, sizes: list[int]) -> int:
+        start = len(sizes)
         total = 0
-        for sent in reversed(sentences):
-            t = self._estimate_tokens(sent)
-            if total + t > self.overlap:
-                break
-            result.insert(0, sent)
-            total += t
-        return result
+        while start and total + sizes[start - 1] <= self.overlap:
+            start -= 1
+            total += sizes[start]
+        return start
 
     def _split_sentences(self, text: str) -> list[str]:
-        parts = re.split(r"(?<=[。！？.!?\n])", text)
+        parts = _SENTENCE_SPLIT_RE.split(text)
         return [p.strip() for p in parts if p.strip()]
 
     def _estimate_tokens(self, text: str) -> int:
-        chinese = len(re.findall(r"[\u4e00-\u9fff]", text))
+        chinese = 0 if text.isascii() else len(_CJK_RE.findall(text))
         if chinese > len(text) * 0.3:
             if self.use_jieba:
                 words = list(self._jieba.cut(text))
@@ -102,7 +105,7 @@ class SemanticChunker:
         return max(int(len(text.split()) * 1.3), len(text) // 4)
 
     def tokenize_for_sparse(self, text: str) -> list[str]:
-        chinese = len(re.findall(r"[\u4e00-\u9fff]", text))
+        chinese = 0 if text.isascii() else len(_CJK_RE.findall(text))
         if chinese > len(text) * 0.3 and self.use_jieba:
             return list(self._jieba.cut_for_search(text))
         return text.lower().split()
@@ -4,6 +4,11 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)")
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_GERMAN_RE = re.compile(r"[äöüÄÖÜß]")
+
 
 class ElementType(Enum):
     TITLE = "title"
@@ -52,7 +57,7 @@ class DocumentParser:
     def _split_markdown(self, text: str) -> list[DocElement]:
         elements = []
         for line in text.splitlines():
-            m = re.match(r"^(#{1,6})\s+(.+)", line)
+            m = _HEADING_RE.match(line) if line.startswith("#") else None
             if m:
                 elements.append(DocElement(type=ElementType.TITLE, text=m.group(2)))
             elif line.strip():
@@ -60,7 +65,7 @@ class DocumentParser:
         return elements
 
     def _split_plaintext(self, text: str) -> list[DocElement]:
-        blocks = re.split(r"\n{2,}", text)
+        blocks = _BLANK_LINES_RE.split(text)
         return [DocElement(type=ElementType.TEXT, text=b.strip()) for b in blocks if b.strip()]
 
     def _parse_with_docling(self, file_path: str) -> list[DocElement]:
@@ -116,11 +121,11 @@ class DocumentParser:
             return "en"
         if not text:
             return "en"
-        chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", text))
+        chinese_chars = len(_CJK_RE.findall(text))
         ratio = chinese_chars / max(len(text), 1)
         if ratio > 0.2:
             return "ch"
-        german_chars = len(re.findall(r"[äöüÄÖÜß]", text))
+        german_chars = len(_GERMAN_RE.findall(text))
         if german_chars > 5:
             return "de"
         return "en"
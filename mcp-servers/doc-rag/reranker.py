@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 
 
 class BGEReranker:
@@ -40,5 +41,5 @@ class BGEReranker:
         scores = await loop.run_in_executor(None, self._rerank_sync, pairs)
         if isinstance(scores, float):
             scores = [scores]
-        indexed = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
-        return [(idx, float(score)) for idx, score in indexed[:top_k]]
+        indexed = heapq.nlargest(top_k, enumerate(scores), key=lambda x: x[1])
+        return [(idx, float(score)) for idx, score in indexed]
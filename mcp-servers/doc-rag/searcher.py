@@ -1,7 +1,8 @@
-import json
+import heapq
 from dataclasses import dataclass
 
 import numpy as np
+import orjson
 
 from store import LanceStore
 from embedder import BGEM3Embedder
@@ -74,13 +75,12 @@ class HybridSearcher:
         scores: list[tuple[float, dict]] = []
         for row in rows:
             try:
-                doc_sparse = json.loads(row.get("sparse_json", "{}"))
+                doc_sparse = orjson.loads(row.get("sparse_json", "{}"))
             except Exception:
                 doc_sparse = {}
             score = sum(float(query_sparse.get(k, 0)) * float(v) for k, v in doc_sparse.items())
             scores.append((score, row))
-        scores.sort(key=lambda x: x[0], reverse=True)
-        return [r for _, r in scores[:top_k]]
+        return [r for _, r in heapq.nlargest(top_k, scores, key=lambda x: x[0])]
 
     def _rrf_fusion(self, dense_results: list[dict], sparse_results: list[dict]) -> list[dict]:
         scores: dict[tuple, float] = {}
@@ -16,6 +16,8 @@ from searcher import HybridSearcher
 mcp = FastMCP("doc-rag")
 
 _config: dict | None = None
+_models: dict | None = None
+_models_lock = asyncio.Lock()
 _instances: dict[str, dict] = {}
 
 
@@ -59,21 +61,31 @@ def _compute_hash(file_path: str) -> str:
     return h.hexdigest()
 
 
+async def _load_models(config: dict) -> dict:
+    global _models
+    async with _models_lock:
+        if _models is None:
+            device = _resolve_device(config)
+            embedder = BGEM3Embedder(config, device)
+            await embedder.load()
+            reranker = BGEReranker(config, device)
+            await reranker.load()
+            _models = {"device": device, "embedder": embedder, "reranker": reranker}
+    return _models
+
+
 async def _ensure_init(project_dir: str) -> dict:
     key = project_dir or "__default__"
     if key in _instances:
         return _instances[key]
 
     config = _load_config()
-    device = _resolve_device(config)
+    models = await _load_models(config)
+    device = models["device"]
+    embedder = models["embedder"]
+    reranker = models["reranker"]
     index_dir = _get_index_dir(project_dir)
 
-    embedder = BGEM3Embedder(config, device)
-    await embedder.load()
-
-    reranker = BGEReranker(config, device)
-    await reranker.load()
-
     dims = config.get("models", {}).get("embedding", {}).get("dimensions", 1024)
     store = LanceStore(index_dir, dims)
     searcher = HybridSearcher(store, embedder, reranker, config)
@@ -96,12 +108,15 @@ def _collect_files(path: str, supported: list[str], file_filter: str) -> list[st
     p = Path(path)
     if p.is_file():
         return [str(p)] if p.suffix.lower() in supported else []
-    files = []
-    for ext in supported:
-        files.extend(p.rglob(f"*{ext}"))
-    result = [str(f) for f in files]
+    suffixes = set(supported)
+    result = []
+    for root, _, names in os.walk(p):
+        for name in names:
+            if os.path.splitext(name)[1].lower() in suffixes:
+                result.append(os.path.join(root, name))
     if file_filter:
-        result = [f for f in result if file_filter.lower() in f.lower()]
+        needle = file_filter.lower()
+        result = [f for f in result if needle in f.lower()]
     return result
 
 
@@ -119,11 +134,14 @@ async def index_documents(path: str, project_dir: str = "", force: bool = False,
         errors = []
         total_chunks = 0
 
+        store: LanceStore = ctx["store"]
         for file_path in files:
             try:
-                content_hash = _compute_hash(file_path)
-                store: LanceStore = ctx["store"]
+                st = os.stat(file_path)
+                signature = [st.st_mtime_ns, st.st_size]
+                content_hash = store.cached_hash(file_path, signature) or _compute_hash(file_path)
                 if not force and store.has_document(file_path, content_hash):
+                    store.remember_hash(file_path, signature, content_hash)
                     skipped += 1
                     continue
                 elements = await ctx["parser"].parse(file_path)
@@ -135,11 +153,13 @@ async def index_documents(path: str, project_dir: str = "", force: bool = False,
                 embeddings = await ctx["embedder"].encode_chunks(texts)
                 store.remove_by_source(file_path)
                 store.upsert(chunks, embeddings, content_hash)
+                store.remember_hash(file_path, signature, content_hash)
                 indexed += 1
                 total_chunks += len(chunks)
             except Exception as e:
                 failed += 1
                 errors.append(f"{file_path}: {e}")
+        store.save_signatures()
 
         return {"indexed": indexed, "skipped": skipped, "failed": failed, "errors": errors, "total_chunks": total_chunks}
     except Exception as e:
@@ -182,6 +202,7 @@ async def remove_documents(paths: str, project_dir: str = "") -> dict:
                 removed += count
             else:
                 not_found.append(p)
+        store.save_signatures()
         return {"removed": removed, "not_found": not_found}
     except Exception as e:
         return {"removed": 0, "not_found": [], "error": str(e)}
@@ -1,10 +1,11 @@
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 import lancedb
 import numpy as np
+import orjson
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from embedder import EmbeddingResult
 from chunker import Chunk
@@ -33,6 +34,25 @@ class LanceStore:
         Path(index_dir).mkdir(parents=True, exist_ok=True)
         self._db = lancedb.connect(index_dir)
         self._table = None
+        self._signatures_path = Path(index_dir) / "signatures.json"
+        self._signatures: dict[str, list] = self._load_signatures()
+
+    def _load_signatures(self) -> dict[str, list]:
+        if self._signatures_path.exists():
+            return orjson.loads(self._signatures_path.read_bytes())
+        return {}
+
+    def cached_hash(self, source: str, signature: list[int]) -> str | None:
+        entry = self._signatures.get(source)
+        if entry and entry[:2] == signature:
+            return entry[2]
+        return None
+
+    def remember_hash(self, source: str, signature: list[int], content_hash: str):
+        self._signatures[source] = [*signature, content_hash]
+
+    def save_signatures(self):
+        self._signatures_path.write_bytes(orjson.dumps(self._signatures))
 
     def _ensure_table(self):
         if self._table is not None:
@@ -54,7 +74,7 @@ class LanceStore:
                 colbert_bytes = vec.tobytes()
             rows.append({
                 "dense_vector": embeddings.dense[i].tolist(),
-                "sparse_json": json.dumps({str(k): float(v) for k, v in sparse.items()}),
+                "sparse_json": orjson.dumps({str(k): float(v) for k, v in sparse.items()}).decode(),
                 "colbert_bytes": colbert_bytes,
                 "text": chunk.text,
                 "source": chunk.source,
@@ -80,6 +100,7 @@ class LanceStore:
         return len(results) > 0
 
     def remove_by_source(self, source: str) -> int:
+        self._signatures.pop(source, None)
         self._ensure_table()
         if self._table is None:
             return 0
@@ -117,12 +138,14 @@ class LanceStore:
             for r in rows
         ]
 
+    def _read_columns(self, columns: list[str]) -> pa.Table:
+        return self._table.search().select(columns).limit(self._table.count_rows()).to_arrow()
+
     def count_documents(self) -> int:
         self._ensure_table()
         if self._table is None:
             return 0
-        rows = self._table.search().select(["source"]).to_list()
-        return len({r["source"] for r in rows})
+        return pc.count_distinct(self._read_columns(["source"]).column("source")).as_py()
 
     def count_chunks(self) -> int:
         self._ensure_table()
@@ -147,13 +170,14 @@ class LanceStore:
         self._ensure_table()
         if self._table is None:
             return []
-        rows = self._table.search().select(["source", "chunk_index", "indexed_at"]).to_list()
-        groups: dict[str, dict] = {}
-        for r in rows:
-            src = r["source"]
-            if src not in groups:
-                groups[src] = {"source": src, "chunks": 0, "last_indexed": r["indexed_at"]}
-            groups[src]["chunks"] += 1
-            if r["indexed_at"] > groups[src]["last_indexed"]:
-                groups[src]["last_indexed"] = r["indexed_at"]
-        return list(groups.values())
+        grouped = self._read_columns(["source", "indexed_at"]).group_by("source").aggregate(
+            [("source", "count"), ("indexed_at", "max")]
+        )
+        return [
+            {"source": src, "chunks": chunks, "last_indexed": last}
+            for src, chunks, last in zip(
+                grouped.column("source").to_pylist(),
+                grouped.column("source_count").to_pylist(),
+                grouped.column("indexed_at_max").to_pylist(),
+            )
+        ]
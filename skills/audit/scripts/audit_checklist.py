@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
+import os
 import sys
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -41,15 +43,34 @@ INCLUDE_SUFFIXES = {
 
 AUDIT_DIR_NAME = ".audit"
 
+HASH_READ_SIZE = 1 << 20
+
 
 def sha256_file(filepath: Path) -> str:
     h = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(HASH_READ_SIZE), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
+def sha256_files(filepaths: list[Path]) -> list[str]:
+    if len(filepaths) < 2:
+        return [sha256_file(fp) for fp in filepaths]
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(sha256_file, filepaths))
+
+
+def hash_checklist_files(project_root: Path, data: dict) -> dict[Path, str]:
+    present = [
+        fp
+        for entries in data["modules"].values()
+        for fp in (project_root / e["path"] for e in entries)
+        if fp.exists()
+    ]
+    return dict(zip(present, sha256_files(present)))
+
+
 def load_config(project_root: Path) -> dict:
     config_path = project_root / AUDIT_DIR_NAME / "config.yaml"
     config = {"exclude_dirs": [], "exclude_files": [], "module_map": {}}
@@ -85,22 +106,8 @@ def load_config(project_root: Path) -> dict:
     return config
 
 
-def is_excluded_dir(rel_parts: tuple, extra_dirs: list) -> bool:
-    all_excludes = BUILTIN_EXCLUDE_DIRS | set(extra_dirs)
-    for part in rel_parts:
-        if part in all_excludes:
-            return True
-    return False
-
-
 def should_include(filepath: Path, root: Path, config: dict) -> bool:
-    rel = filepath.relative_to(root)
-    parts = rel.parts
-
-    if is_excluded_dir(parts, config.get("exclude_dirs", [])):
-        return False
-
-    rel_posix = rel.as_posix()
+    rel_posix = filepath.relative_to(root).as_posix()
     for ef in config.get("exclude_files", []):
         if rel_posix == ef or filepath.name == ef:
             return False
@@ -119,6 +126,21 @@ def should_include(filepath: Path, root: Path, config: dict) -> bool:
     return True
 
 
+def walk_project_files(project_root: Path, config: dict) -> list[Path]:
+    excluded = BUILTIN_EXCLUDE_DIRS | set(config.get("exclude_dirs", []))
+    files = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        if not excluded.isdisjoint(dirnames):
+            dirnames[:] = [d for d in dirnames if d not in excluded]
+        base = Path(dirpath)
+        for name in filenames:
+            filepath = base / name
+            if should_include(filepath, project_root, config) and filepath.is_file():
+                files.append(filepath)
+    files.sort()
+    return files
+
+
 def detect_module(rel_path: str, module_map: dict) -> str:
     normalized = rel_path.replace("\\", "/")
 
@@ -270,15 +292,11 @@ def cmd_generate(project_root: Path):
     module_files: dict[str, list] = {}
     total = 0
 
-    for filepath in sorted(project_root.rglob("*")):
-        if not filepath.is_file():
-            continue
-        if not should_include(filepath, project_root, config):
-            continue
+    candidates = walk_project_files(project_root, config)
 
+    for filepath, h in zip(candidates, sha256_files(candidates)):
         rel = filepath.relative_to(project_root).as_posix()
         module = detect_module(rel, module_map)
-        h = sha256_file(filepath)
 
         if module not in module_files:
             module_files[module] = []
@@ -314,15 +332,16 @@ def cmd_verify(project_root: Path):
     data = load_yaml_simple(cl)
     stats = {"audited": 0, "pending": 0, "stale": 0, "modified": 0, "missing": 0, "unchanged": 0}
 
+    current_hashes = hash_checklist_files(project_root, data)
+
     for module, entries in data["modules"].items():
         for e in entries:
-            fp = project_root / e["path"]
-            if not fp.exists():
+            current_hash = current_hashes.get(project_root / e["path"])
+            if current_hash is None:
                 print(f"MISSING  {e['path']}")
                 stats["missing"] += 1
                 continue
 
-            current_hash = sha256_file(fp)
             if current_hash != e["sha256"]:
                 if e["status"] == "audited":
                     print(f"STALE    {e['path']}  (was audited, file changed)")
@@ -367,15 +386,16 @@ def cmd_refresh(project_root: Path):
     data = load_yaml_simple(cl)
     stats = {"unchanged": 0, "stale": 0, "modified": 0, "missing": 0}
 
+    current_hashes = hash_checklist_files(project_root, data)
+
     for module, entries in data["modules"].items():
         for e in entries:
-            fp = project_root / e["path"]
-            if not fp.exists():
+            current_hash = current_hashes.get(project_root / e["path"])
+            if current_hash is None:
                 print(f"MISSING  {e['path']}")
                 stats["missing"] += 1
                 continue
 
-            current_hash = sha256_file(fp)
             if current_hash != e["sha256"]:
                 old_status = e["status"]
                 e["sha256"] = current_hash